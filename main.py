@@ -28,10 +28,16 @@ def scrape_command(args: Optional[argparse.Namespace] = None) -> None:
     print(f"📂 Saída: {output_file}")
     print()
 
-    scraper = NewsLinkScraper()
+    scraper_options = {}
+    if args is not None and args.workers:
+        scraper_options['max_workers'] = args.workers
+    if args is not None and args.cache:
+        scraper_options['cache_path'] = args.cache
+    scraper = NewsLinkScraper(**scraper_options)
 
     try:
-        total_sites, sites_with_news = scraper.scrape_from_csv(input_file, output_file)
+        with scraper:
+            total_sites, sites_with_news = scraper.scrape_from_csv(input_file, output_file)
         success_rate = (sites_with_news / total_sites) * 100
 
         print()
@@ -96,6 +102,8 @@ def main():
         epilog="""
 Exemplos:
     python main.py scrape        # Raspar URLs de notícias
+    python main.py scrape --workers 8   # Raspar com 8 sites simultâneos
+    python main.py scrape --cache data/stage/http_cache   # Reutilizar páginas já baixadas
     python main.py update_urls   # Atualizar arquivo de configuração
         """
     )
@@ -110,6 +118,16 @@ Exemplos:
         'scrape',
         help='Raspar URLs de notícias dos sites governamentais'
     )
+    scrape_parser.add_argument(
+        '--workers',
+        type=int,
+        help='Número de sites processados simultaneamente (padrão: 20)'
+    )
+    scrape_parser.add_argument(
+        '--cache',
+        metavar='ARQUIVO',
+        help='Cache HTTP em disco (SQLite) reutilizado entre execuções; requer requests-cache'
+    )
 
     update_parser = subparsers.add_parser(
         'update_urls',
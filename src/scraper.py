@@ -6,15 +6,181 @@ A robust web scraper that finds news links in Brazilian government websites.
 Uses multiple fallback strategies to maximize link discovery success rate.
 """
 
+import json
 import logging
 import os
+import re
+import threading
 import time
-from typing import List, Optional, Tuple
-from urllib.parse import urljoin
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Dict, Hashable, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer the C-backed lxml tree builder; fall back to the pure-Python parser
+try:
+    import lxml  # type: ignore[import-untyped]  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional on-disk HTTP cache, only used when a cache_path is given
+try:
+    import requests_cache  # type: ignore[import-not-found]
+except ImportError:
+    requests_cache = None
+
+# How long cached pages are reused across runs
+HTTP_CACHE_EXPIRE_AFTER = timedelta(days=1)
+
+# Link texts searched by the fallback strategies (in _normalize_text form)
+NEWS_TEXT = 'notícias'.casefold()
+MORE_NEWS_TEXT = 'mais notícias'.casefold()
+LATEST_NEWS_TEXT = 'últimas notícias'.casefold()
+
+# Footer container, matched by a strainer built once instead of per page
+FOOTER_CLASS = 'footer-wrapper'
+FOOTER_MATCHER = SoupStrainer('div', class_=FOOTER_CLASS)
+
+# Only links, divs (which hold the footer) and <link> tags (feeds declared
+# in <head>) are built into the tree; scripts and other markup are skipped
+PAGE_STRAINER = SoupStrainer(['a', 'div', 'link'])
+
+# Promotional or overly specific links skipped by the generic fallback
+SKIP_PATTERN = re.compile(r'g20|evento|campanha|especial|promocao', re.IGNORECASE)
+
+# Highest score _select_best_news_link can give; no later link can beat it
+MAX_LINK_SCORE = 100 + 50 + 10 + 5
+
+# Suffix of the append-only progress file kept next to the output CSV
+PROGRESS_SUFFIX = '.partial.jsonl'
+
+# A page link with its normalized text and raw href, see _collect_anchors
+Anchor = Tuple[Tag, str, str]
+
+# Pages are streamed and truncated past this size to bound memory per fetch
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Raw-bytes probe for "notícias" (UTF-8, Latin-1 or HTML entity for the í).
+# Every strategy, including the feed title check, needs this text, so pages
+# without it cannot match and are not parsed at all.
+NEWS_TEXT_PROBE = re.compile(
+    rb'not(?:\xc3\xad|\xc3\x8d|\xed|\xcd|&iacute;|&Iacute;|&#237;|&#205;|&#xed;|&#xcd;)cias',
+    re.IGNORECASE
+)
+
+
+def _normalize_text(text: str) -> str:
+    """
+    Normalize link text for comparison.
+
+    Collapses whitespace runs (like XPath's normalize-space) and casefolds,
+    so link texts and search phrases are compared in the same form.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text
+    """
+    return ' '.join(text.split()).casefold()
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Normalize a portal URL for use as a cache key.
+
+    Scheme and host are lowercased and the fragment is dropped, so
+    equivalent spellings of the same portal share a key. The path is kept
+    as is: portals share the www.gov.br host, and relative links resolve
+    differently with and without a trailing slash.
+
+    Args:
+        url: Portal URL
+
+    Returns:
+        Normalized URL
+    """
+    parts = urlparse(url.strip())
+    return parts._replace(
+        scheme=parts.scheme.lower(),
+        netloc=parts.netloc.lower(),
+        fragment=''
+    ).geturl()
+
+
+_LOGGER: Optional[logging.Logger] = None
+
+
+def _get_logger() -> logging.Logger:
+    """
+    Get the scraper logger, configuring it on first use.
+
+    Handlers are set up once per process rather than per scraper instance.
+    Set GOVBR_NO_FILE_LOG=1 to skip the scraping_log.txt file handler
+    (e.g. in tests).
+
+    Returns:
+        Configured logger instance
+    """
+    global _LOGGER
+
+    if _LOGGER is None:
+        logger = logging.getLogger('govbr_news_scraper')
+        logger.setLevel(logging.INFO)
+
+        # Avoid duplicate handlers
+        if not logger.handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+            # File handler
+            if not os.environ.get('GOVBR_NO_FILE_LOG'):
+                file_handler = logging.FileHandler('scraping_log.txt')
+                file_handler.setLevel(logging.INFO)
+                file_handler.setFormatter(formatter)
+                logger.addHandler(file_handler)
+
+            # Console handler
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(formatter)
+            logger.addHandler(console_handler)
+
+        _LOGGER = logger
+
+    return _LOGGER
+
+
+@lru_cache(maxsize=4096)
+def _abs_url(base_url: str, href: str) -> str:
+    """
+    Resolve an href against a base URL.
+
+    Cached because the same (base, href) pairs are resolved repeatedly while
+    scoring candidates, and relative paths like '/noticias' recur across sites.
+    Everything but absolute http(s) links goes through urljoin, which also
+    covers protocol-relative ('//host/path') and dot-segment hrefs.
+
+    Args:
+        base_url: The base URL for converting relative URLs
+        href: The href attribute value (may be relative or absolute)
+
+    Returns:
+        Absolute URL
+    """
+    if href.startswith(('https://', 'http://')):
+        return href
+    return urljoin(base_url, href)
 
 
 class NewsLinkScraper:
@@ -31,75 +197,270 @@ class NewsLinkScraper:
         self,
         request_timeout: int = 30,
         request_delay: float = 2.0,
-        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        max_workers: int = 20,
+        max_per_host: int = 4,
+        cache_path: Optional[str] = None
     ) -> None:
         """
         Initialize the NewsLinkScraper.
 
         Args:
             request_timeout: Timeout for HTTP requests in seconds
-            request_delay: Delay between requests in seconds to avoid overloading servers
+            request_delay: Delay between requests to the same host in seconds
+                to avoid overloading servers
             user_agent: User agent string for HTTP requests
+            max_workers: Maximum number of sites fetched concurrently
+            max_per_host: Maximum number of concurrent requests to one host
+            cache_path: Optional SQLite file for an HTTP cache shared across
+                runs (requires requests-cache)
         """
         self.request_timeout = request_timeout
         self.request_delay = request_delay
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.cache_path = cache_path
         self.headers = {'User-Agent': user_agent}
-        self.logger = self._setup_logger()
-
-    def _setup_logger(self) -> logging.Logger:
+        self._host_lock = threading.Lock()
+        self._next_request_at: Dict[str, float] = {}
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._metrics: Counter = Counter()
+        self._metrics_lock = threading.Lock()
+        self._news_link_cache: Dict[str, str] = {}
+        self._news_link_locks: Dict[str, threading.Lock] = {}
+        self._cache_lock = threading.Lock()
+        self.logger = _get_logger()
+        self.session = self._setup_session()
+
+    def _setup_session(self) -> requests.Session:
         """
-        Set up logging configuration.
+        Set up a shared HTTP session with connection pooling and retries.
+
+        Reusing one session keeps connections alive between requests, so
+        consecutive portals on the same host skip the DNS lookup and the
+        TCP/TLS handshake. The pool holds one connection per worker thread;
+        a smaller pool would discard connections and reconnect.
+
+        With a cache_path, responses are also kept in an SQLite cache for
+        HTTP_CACHE_EXPIRE_AFTER, so re-runs skip unchanged portals.
 
         Returns:
-            Configured logger instance
+            Configured requests session
         """
-        logger = logging.getLogger('govbr_news_scraper')
-        logger.setLevel(logging.INFO)
+        if self.cache_path and requests_cache is not None:
+            session = requests_cache.CachedSession(
+                self.cache_path,
+                backend='sqlite',
+                expire_after=HTTP_CACHE_EXPIRE_AFTER,
+                allowable_codes=(200, 301, 302)
+            )
+        else:
+            if self.cache_path:
+                self.logger.warning("requests-cache não instalado; cache HTTP desativado")
+            session = requests.Session()
+        session.headers.update(self.headers)
+
+        # Exponential backoff with jitter; Retry-After is honored on 429/503
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_jitter=0.25,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=max(self.max_workers, 1),
+            max_retries=retries
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
 
-        # Avoid duplicate handlers
-        if not logger.handlers:
-            # File handler
-            file_handler = logging.FileHandler('scraping_log.txt')
-            file_handler.setLevel(logging.INFO)
+        return session
 
-            # Console handler
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
+    def close(self) -> None:
+        """Close the HTTP session and release pooled connections."""
+        self.session.close()
 
-            # Formatter
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
+    def __enter__(self) -> 'NewsLinkScraper':
+        """Use the scraper as a context manager that closes its session."""
+        return self
 
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+    def __exit__(self, *exc_info) -> None:
+        """Close the HTTP session when leaving the context."""
+        self.close()
+
+    def _count(self, metric: str) -> None:
+        """
+        Increment a request metric (thread-safe).
+
+        Args:
+            metric: Name of the metric to increment
+        """
+        with self._metrics_lock:
+            self._metrics[metric] += 1
+
+    def _wait_for_host(self, url: str) -> None:
+        """
+        Wait until the URL's host may be requested again.
+
+        Each host gets request slots spaced by request_delay. A worker
+        reserves the next free slot under a lock and only sleeps when that
+        slot is in the future, so requests to different hosts never wait
+        on each other.
+
+        Args:
+            url: The URL about to be requested
+        """
+        host = urlparse(url).netloc
 
-        return logger
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at.get(host, now))
+            self._next_request_at[host] = slot + self.request_delay
+
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+
+    def _is_cached(self, url: str) -> bool:
+        """
+        Check whether the HTTP cache already holds a response for the URL.
+
+        Args:
+            url: The URL about to be requested
+
+        Returns:
+            True if the session is a requests-cache session with the URL cached
+        """
+        cache = getattr(self.session, 'cache', None)
+        return cache is not None and cache.contains(url=url)
+
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        """
+        Get the semaphore capping concurrent requests to the URL's host.
+
+        Args:
+            url: The URL about to be requested
+
+        Returns:
+            Semaphore shared by all requests to the same host
+        """
+        host = urlparse(url).netloc
+
+        with self._host_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_semaphores[host]
 
     def _make_request(self, url: str) -> Optional[BeautifulSoup]:
         """
         Make an HTTP request and return parsed HTML.
 
+        Non-HTML responses (PDFs, JSON error pages) are not downloaded, and
+        pages whose raw content never mentions "notícias" are not parsed,
+        since no search strategy could find a link in them. Network errors
+        are counted and logged; any other error propagates to the caller.
+
+        Responses already in the HTTP cache never reach the host, so they
+        skip the per-host delay.
+
         Args:
             url: The URL to fetch
 
         Returns:
             BeautifulSoup object if successful, None otherwise
         """
+        if not self._is_cached(url):
+            self._wait_for_host(url)
+
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.request_timeout)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            with self._host_semaphore(url):
+                response = self.session.get(url, timeout=self.request_timeout, stream=True)
+                try:
+                    response.raise_for_status()
+                    if not self._is_html(response):
+                        self._count('not_html')
+                        self.logger.info(f"Resposta de {url} não é HTML; página não analisada")
+                        return None
+                    content = self._read_content(response, url)
+                    encoding = self._declared_encoding(response)
+                finally:
+                    response.close()
         except requests.exceptions.Timeout:
+            self._count('timeout')
             self.logger.error(f"Timeout ao acessar {url}")
             return None
         except requests.exceptions.RequestException as e:
+            self._count('request_error')
             self.logger.error(f"Erro ao acessar {url}: {str(e)}")
             return None
-        except Exception as e:
-            self.logger.error(f"Erro inesperado ao processar {url}: {str(e)}")
+
+        if not NEWS_TEXT_PROBE.search(content):
+            self._count('skipped_parse')
+            self.logger.info(f"Nenhuma menção a notícias em {url}; página não analisada")
             return None
 
+        return BeautifulSoup(content, HTML_PARSER, from_encoding=encoding,
+                             parse_only=PAGE_STRAINER)
+
+    def _is_html(self, response: requests.Response) -> bool:
+        """
+        Check whether the response Content-Type announces an HTML page.
+
+        Responses without a Content-Type header are assumed to be HTML.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            True unless the Content-Type names another media type
+        """
+        content_type = response.headers.get('Content-Type', '').lower()
+        return not content_type or 'html' in content_type
+
+    def _declared_encoding(self, response: requests.Response) -> Optional[str]:
+        """
+        Get the charset declared in the response Content-Type header.
+
+        Passing it to BeautifulSoup skips its encoding detection. requests
+        falls back to ISO-8859-1 for text/html without a charset, so that
+        case returns None and lets the parser read the <meta> declaration.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Declared encoding, or None if the header has no charset
+        """
+        content_type = response.headers.get('Content-Type', '')
+        if 'charset=' not in content_type.lower():
+            return None
+        return response.encoding
+
+    def _read_content(self, response: requests.Response, url: str) -> bytes:
+        """
+        Read a streamed response body, stopping at MAX_PAGE_BYTES.
+
+        Args:
+            response: Response obtained with stream=True
+            url: The requested URL, for logging
+
+        Returns:
+            Response body, truncated if the page is too large
+        """
+        chunks = []
+        size = 0
+
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_PAGE_BYTES:
+                self.logger.warning(f"Página {url} excede {MAX_PAGE_BYTES} bytes; conteúdo truncado")
+                break
+
+        return b''.join(chunks)
+
     def _convert_to_absolute_url(self, href: str, base_url: str) -> str:
         """
         Convert a relative URL to an absolute URL.
@@ -111,46 +472,72 @@ class NewsLinkScraper:
         Returns:
             Absolute URL
         """
-        if href.startswith('/'):
-            return urljoin(base_url, href)
-        elif not href.startswith('http'):
-            return urljoin(base_url, href)
-        return href
+        return _abs_url(base_url, href)
 
-    def _find_links_by_text(self, soup: BeautifulSoup, search_text: str,
-                           container: Optional[Tag] = None) -> List[Tag]:
+    def _collect_anchors(self, soup: Tag) -> List[Anchor]:
         """
-        Find links with intelligent text matching (prioritizes exact matches).
+        Collect every link of a page together with its normalized text and href.
+
+        The page is walked once and the result is shared by all search
+        strategies, instead of each strategy calling find_all('a') and
+        re-extracting link texts again.
+        Texts are normalized with _normalize_text, so link texts broken
+        across lines or indented in the markup still match.
 
         Args:
-            soup: BeautifulSoup object to search in
+            soup: Parsed page, or an element of it, to collect links from
+
+        Returns:
+            List of (link tag, normalized link text, href) tuples
+        """
+        return [
+            (link, _normalize_text(link.text), str(link.get('href', '')))
+            for link in soup.find_all('a')
+        ]
+
+    def _anchors_in(self, anchors: List[Anchor], container: Tag) -> List[Anchor]:
+        """
+        Keep only the precomputed links that are inside a container.
+
+        Args:
+            anchors: Links precomputed by _collect_anchors
+            container: Element limiting the scope
+
+        Returns:
+            Links inside the container, in page order
+        """
+        container_ids = {id(link) for link in container.find_all('a')}
+        return [anchor for anchor in anchors if id(anchor[0]) in container_ids]
+
+    def _match_anchors(self, anchors: List[Anchor], search_text: str) -> List[Anchor]:
+        """
+        Match links by text with priority (exact, then ends with, then starts with).
+
+        Args:
+            anchors: Links precomputed by _collect_anchors
             search_text: Text to search for in link text
-            container: Optional container to limit search scope
 
         Returns:
-            List of link tags with prioritized matching
+            Matching links of the highest priority class found
         """
-        search_container = container or soup
-        search_text_clean = search_text.lower().strip()
-        all_links = search_container.find_all('a')
+        search_text_clean = _normalize_text(search_text)
 
         exact_matches = []
         ends_with_matches = []
         starts_with_matches = []
 
-        for link in all_links:
-            if link.text:
-                link_text_clean = link.text.lower().strip()
-
+        for anchor in anchors:
+            link_text_clean = anchor[1]
+            if link_text_clean:
                 # Priority 1: Exact match (e.g., "notícias")
                 if link_text_clean == search_text_clean:
-                    exact_matches.append(link)
+                    exact_matches.append(anchor)
                 # Priority 2: Ends with search text (e.g., "principais notícias")
                 elif link_text_clean.endswith(search_text_clean):
-                    ends_with_matches.append(link)
+                    ends_with_matches.append(anchor)
                 # Priority 3: Starts with search text (e.g., "notícias siscomex")
                 elif link_text_clean.startswith(search_text_clean):
-                    starts_with_matches.append(link)
+                    starts_with_matches.append(anchor)
 
         # Return in order of priority
         if exact_matches:
@@ -162,6 +549,28 @@ class NewsLinkScraper:
         else:
             return []
 
+    def _find_links_by_text(self, soup: BeautifulSoup, search_text: str,
+                           container: Optional[Tag] = None,
+                           anchors: Optional[List[Anchor]] = None) -> List[Tag]:
+        """
+        Find links with intelligent text matching (prioritizes exact matches).
+
+        Args:
+            soup: BeautifulSoup object to search in
+            search_text: Text to search for in link text
+            container: Optional container to limit search scope
+            anchors: Optional links precomputed by _collect_anchors
+
+        Returns:
+            List of link tags with prioritized matching
+        """
+        if anchors is None:
+            anchors = self._collect_anchors(container or soup)
+        elif container is not None:
+            anchors = self._anchors_in(anchors, container)
+
+        return [link for link, _, _ in self._match_anchors(anchors, search_text)]
+
     def _extract_link_url(self, link: Tag, base_url: str) -> Optional[str]:
         """
         Extract and validate URL from a link tag.
@@ -179,31 +588,38 @@ class NewsLinkScraper:
 
         return self._convert_to_absolute_url(href, base_url)
 
-    def _search_footer_news_links(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+    def _search_footer_news_links(self, soup: BeautifulSoup, url: str,
+                                  anchors: Optional[List[Anchor]] = None) -> Optional[str]:
         """
         Search for news links in the footer section with intelligent selection.
 
         Args:
             soup: Parsed HTML content
             url: Base URL for converting relative links
+            anchors: Optional links precomputed by _collect_anchors
 
         Returns:
             News link URL if found, None otherwise
         """
-        footer_div = soup.find('div', class_='footer-wrapper')
+        footer_div = soup.find(FOOTER_MATCHER)
 
         if not footer_div:
-            self.logger.warning(f"Div footer-wrapper não encontrada em {url}")
+            self.logger.warning(f"Div {FOOTER_CLASS} não encontrada em {url}")
             return None
 
-        news_links = self._find_links_by_text(soup, 'notícias', footer_div)
+        if anchors is None:
+            footer_anchors = self._collect_anchors(footer_div)
+        else:
+            footer_anchors = self._anchors_in(anchors, footer_div)
+
+        news_anchors = self._match_anchors(footer_anchors, NEWS_TEXT)
 
-        if news_links:
+        if news_anchors:
             # Se há múltiplos links, usar lógica inteligente de seleção
-            if len(news_links) > 1:
-                selected_link = self._select_best_news_link(news_links, url)
+            if len(news_anchors) > 1:
+                selected_link = self._select_best_news_link(news_anchors, url)
             else:
-                selected_link = news_links[0]
+                selected_link = news_anchors[0][0]
 
             link_url = self._extract_link_url(selected_link, url)
             if link_url:
@@ -212,7 +628,7 @@ class NewsLinkScraper:
 
         return None
 
-    def _select_best_news_link(self, links: List[Tag], base_url: str) -> Tag:
+    def _select_best_news_link(self, anchors: List[Anchor], base_url: str) -> Tag:
         """
         Select the best news link from multiple options using intelligent criteria.
 
@@ -223,59 +639,61 @@ class NewsLinkScraper:
         4. First found as fallback
 
         Args:
-            links: List of link tags to choose from
+            anchors: Links (as returned by _collect_anchors) to choose from
             base_url: Base URL for analysis
 
         Returns:
             The best link tag
         """
-        scored_links = []
+        best = None
 
-        for link in links:
-            href = link.get('href', '')
-            text = link.get_text(strip=True).lower()
+        for link, text, href in anchors:
             score = 0
 
             if href:
                 absolute_url = self._convert_to_absolute_url(href, base_url)
+                absolute_url_lower = absolute_url.lower()
 
                 # Scoring criteria
-                if 'comunicacao' in absolute_url.lower():
+                if 'comunicacao' in absolute_url_lower:
                     score += 100  # High priority for communication links
                 if 'ultimas' in text:
                     score += 50   # Priority for "últimas notícias"
                 if absolute_url.count('/') <= 6:  # Prefer shorter paths
                     score += 10
-                if 'noticias' in absolute_url.lower():
+                if 'noticias' in absolute_url_lower:
                     score += 5
 
-                scored_links.append((score, link))
+                # Strictly greater keeps the first link among equal scores
+                if best is None or score > best[0]:
+                    best = (score, link, text)
+                    if score == MAX_LINK_SCORE:
+                        break
 
-        # Sort by score (highest first) and return best
-        scored_links.sort(key=lambda x: x[0], reverse=True)
-
-        if scored_links:
-            best_score, best_link = scored_links[0]
-            self.logger.info(f"Selecionado link com score {best_score}: {best_link.get_text(strip=True)}")
+        if best:
+            best_score, best_link, best_text = best
+            self.logger.info(f"Selecionado link com score {best_score}: {best_text}")
             return best_link
 
         # Fallback to first link if scoring fails
-        return links[0]
+        return anchors[0][0]
 
-    def _search_more_news_links(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+    def _search_more_news_links(self, soup: BeautifulSoup, url: str,
+                                anchors: Optional[List[Anchor]] = None) -> Optional[str]:
         """
         Search for "Mais Notícias" links throughout the page.
 
         Args:
             soup: Parsed HTML content
             url: Base URL for converting relative links
+            anchors: Optional links precomputed by _collect_anchors
 
         Returns:
             News link URL if found, None otherwise
         """
         self.logger.info(f"Tentando fallback: procurando 'Mais Notícias' em toda a página de {url}")
 
-        more_news_links = self._find_links_by_text(soup, 'mais notícias')
+        more_news_links = self._find_links_by_text(soup, MORE_NEWS_TEXT, anchors=anchors)
 
         if more_news_links:
             link_url = self._extract_link_url(more_news_links[0], url)
@@ -285,20 +703,22 @@ class NewsLinkScraper:
 
         return None
 
-    def _search_latest_news_links(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+    def _search_latest_news_links(self, soup: BeautifulSoup, url: str,
+                                  anchors: Optional[List[Anchor]] = None) -> Optional[str]:
         """
         Search for "Últimas Notícias" links throughout the page.
 
         Args:
             soup: Parsed HTML content
             url: Base URL for converting relative links
+            anchors: Optional links precomputed by _collect_anchors
 
         Returns:
             News link URL if found, None otherwise
         """
         self.logger.info(f"Tentando segundo fallback: procurando 'Últimas Notícias' em toda a página de {url}")
 
-        latest_news_links = self._find_links_by_text(soup, 'últimas notícias')
+        latest_news_links = self._find_links_by_text(soup, LATEST_NEWS_TEXT, anchors=anchors)
 
         if latest_news_links:
             link_url = self._extract_link_url(latest_news_links[0], url)
@@ -308,42 +728,42 @@ class NewsLinkScraper:
 
         return None
 
-    def _search_generic_news_links(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+    def _search_generic_news_links(self, soup: BeautifulSoup, url: str,
+                                   anchors: Optional[List[Anchor]] = None) -> Optional[str]:
         """
         Search for generic "Notícias" links throughout the page as final fallback.
 
         Args:
             soup: Parsed HTML content
             url: Base URL for converting relative links
+            anchors: Optional links precomputed by _collect_anchors
 
         Returns:
             News link URL if found, None otherwise
         """
         self.logger.info(f"Tentando fallback final: procurando 'Notícias' genérico em toda a página de {url}")
 
+        if anchors is None:
+            anchors = self._collect_anchors(soup)
+
         # Use intelligent matching to avoid specific/promotional news links
-        news_links = self._find_links_by_text(soup, 'notícias')
+        news_anchors = self._match_anchors(anchors, NEWS_TEXT)
 
-        if news_links:
+        if news_anchors:
             # Filter out obviously promotional or specific links
-            filtered_links = []
-            for link in news_links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True).lower()
-
-                # Skip overly specific or promotional links
-                skip_patterns = ['g20', 'evento', 'campanha', 'especial', 'promocao']
-                if not any(pattern in text or pattern in href.lower() for pattern in skip_patterns):
-                    filtered_links.append(link)
+            filtered_anchors = [
+                anchor for anchor in news_anchors
+                if not (SKIP_PATTERN.search(anchor[1]) or SKIP_PATTERN.search(anchor[2]))
+            ]
 
             # Use filtered links if available, otherwise use original
-            target_links = filtered_links if filtered_links else news_links
+            target_anchors = filtered_anchors if filtered_anchors else news_anchors
 
             # Select best from available options
-            if len(target_links) > 1:
-                selected_link = self._select_best_news_link(target_links, url)
+            if len(target_anchors) > 1:
+                selected_link = self._select_best_news_link(target_anchors, url)
             else:
-                selected_link = target_links[0]
+                selected_link = target_anchors[0][0]
 
             link_url = self._extract_link_url(selected_link, url)
             if link_url:
@@ -352,6 +772,34 @@ class NewsLinkScraper:
 
         return None
 
+    def _search_feed_news_links(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+        """
+        Search the <link rel="alternate"> feeds for a news feed as last resort.
+
+        Only RSS/Atom feeds whose title mentions "Notícias" are considered,
+        so a site-wide feed is not mistaken for the news section. The feed
+        URL is not checked for "noticias": a page with no other mention of
+        news is already skipped by NEWS_TEXT_PROBE and never parsed.
+
+        Args:
+            soup: Parsed HTML content
+            url: Base URL for converting relative links
+
+        Returns:
+            News feed URL if found, None otherwise
+        """
+        for feed in soup.find_all('link', rel='alternate', href=True):
+            feed_type = str(feed.get('type', '')).lower()
+            if 'rss' not in feed_type and 'atom' not in feed_type:
+                continue
+
+            if NEWS_TEXT in _normalize_text(str(feed.get('title', ''))):
+                feed_url = self._convert_to_absolute_url(str(feed['href']), url)
+                self.logger.info(f"Feed de notícias encontrado em {url}: {feed_url}")
+                return feed_url
+
+        return None
+
     def find_news_link(self, url: str) -> str:
         """
         Find a news link for a given website using multiple strategies.
@@ -361,6 +809,32 @@ class NewsLinkScraper:
         2. Search for "Últimas Notícias" in entire page (higher priority than generic)
         3. Search for "Mais Notícias" in entire page
         4. Search for "Notícias" in entire page (broader fallback)
+        5. Use a news RSS/Atom feed declared in <head> (last resort)
+
+        Results are cached per normalized URL for the lifetime of the
+        scraper, so a portal listed more than once is only fetched once,
+        even when its rows are processed by different worker threads.
+
+        Args:
+            url: The website URL to search for news links
+
+        Returns:
+            News link URL if found, empty string otherwise
+        """
+        key = _normalize_url(url)
+
+        with self._cache_lock:
+            url_lock = self._news_link_locks.setdefault(key, threading.Lock())
+
+        # A second thread asking for the same portal waits for the first
+        with url_lock:
+            if key not in self._news_link_cache:
+                self._news_link_cache[key] = self._search_news_link(url)
+            return self._news_link_cache[key]
+
+    def _search_news_link(self, url: str) -> str:
+        """
+        Fetch a website and run the search strategies of find_news_link.
 
         Args:
             url: The website URL to search for news links
@@ -372,23 +846,39 @@ class NewsLinkScraper:
         if not soup:
             return ""
 
+        # Walk the page once and share the links across all strategies.
+        # Every searched phrase contains "notícias", so a single substring
+        # scan per link discards the rest before any per-phrase comparison.
+        anchors = [anchor for anchor in self._collect_anchors(soup) if NEWS_TEXT in anchor[1]]
+
+        # No link mentions "notícias": every link strategy would fail, so skip
+        # them, including the footer lookup that walks the whole tree
+        if not anchors:
+            self.logger.info(f"Nenhum link com 'Notícias' em {url}")
+            return self._search_feed_news_links(soup, url) or ""
+
         # Strategy 1: Footer news links
-        news_link = self._search_footer_news_links(soup, url)
+        news_link = self._search_footer_news_links(soup, url, anchors)
         if news_link:
             return news_link
 
         # Strategy 2: "Últimas Notícias" fallback (prioritized for better relevance)
-        news_link = self._search_latest_news_links(soup, url)
+        news_link = self._search_latest_news_links(soup, url, anchors)
         if news_link:
             return news_link
 
         # Strategy 3: "Mais Notícias" fallback
-        news_link = self._search_more_news_links(soup, url)
+        news_link = self._search_more_news_links(soup, url, anchors)
+        if news_link:
+            return news_link
+
+        # Strategy 4: Generic "Notícias" fallback
+        news_link = self._search_generic_news_links(soup, url, anchors)
         if news_link:
             return news_link
 
-        # Strategy 4: Generic "Notícias" fallback (last resort)
-        news_link = self._search_generic_news_links(soup, url)
+        # Strategy 5: News feed declared in <head> (last resort)
+        news_link = self._search_feed_news_links(soup, url)
         if news_link:
             return news_link
 
@@ -398,12 +888,117 @@ class NewsLinkScraper:
         )
         return ""
 
+    def _process_site(self, url: str) -> str:
+        """
+        Find the news link for a single site.
+
+        Runs inside a worker thread of scrape_from_csv. Rate limiting is
+        applied per host by _make_request.
+
+        Args:
+            url: The website URL to search for news links
+
+        Returns:
+            News link URL if found, empty string otherwise
+        """
+        self.logger.info(f"Processando: {url}")
+
+        return self.find_news_link(url)
+
+    def _interleave_by_host(self, urls: pd.Series) -> List[Tuple[Hashable, str]]:
+        """
+        Order sites round-robin by host.
+
+        Consecutive work items then hit different hosts whenever possible,
+        so workers spend less time waiting on the per-host request delay.
+
+        Args:
+            urls: Site URLs indexed by their DataFrame row
+
+        Returns:
+            List of (row index, url) tuples in scheduling order
+        """
+        by_host: Dict[str, List[Tuple[Hashable, str]]] = {}
+        for index, url in zip(urls.index.tolist(), urls.tolist()):
+            by_host.setdefault(urlparse(url).netloc, []).append((index, url))
+
+        return [
+            item
+            for round_items in zip_longest(*by_host.values())
+            for item in round_items
+            if item is not None
+        ]
+
+    def _apply_results(self, df: pd.DataFrame, news_column: str,
+                       pending: List[Tuple[Hashable, str]]) -> None:
+        """
+        Write pending (row index, news link) results into the DataFrame.
+
+        Results are assigned in one vectorized operation instead of one
+        cell at a time, and the pending list is emptied afterwards.
+
+        Args:
+            df: DataFrame being filled
+            news_column: Name of the column storing news links
+            pending: Results not yet written to the DataFrame
+        """
+        if not pending:
+            return
+
+        indices, news_links = zip(*pending)
+        df.loc[list(indices), news_column] = list(news_links)
+        pending.clear()
+
+    def _replay_progress(self, df: pd.DataFrame, progress_file: str,
+                         portal_column: str, news_column: str) -> List[Hashable]:
+        """
+        Restore results saved by an interrupted run into the DataFrame.
+
+        Entries are only applied when the row still holds the same portal
+        URL, so a progress file left over from another input is ignored.
+
+        Args:
+            df: DataFrame being filled
+            progress_file: Path to the JSONL progress file
+            portal_column: Name of the column containing website URLs
+            news_column: Name of the column storing news links
+
+        Returns:
+            Row indices restored from the progress file
+        """
+        if not os.path.exists(progress_file):
+            return []
+
+        restored: List[Tuple[Hashable, str]] = []
+        with open(progress_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line may be incomplete if the run crashed mid-write
+                    continue
+
+                index = entry['idx']
+                if index in df.index and df.at[index, portal_column] == entry['url']:
+                    restored.append((index, entry['news']))
+
+        indices = [index for index, _ in restored]
+        self._apply_results(df, news_column, restored)
+        self.logger.info(f"{len(indices)} resultados restaurados de {progress_file}")
+
+        return indices
+
     def scrape_from_csv(self, input_file: str, output_file: str,
                         portal_column: str = 'Portal',
                         news_column: str = 'Noticias') -> Tuple[int, int]:
         """
         Process a CSV file to find news links for all sites.
 
+        Each result is appended to a JSONL progress file next to the output
+        as soon as it is found. If the run is interrupted, the next run with
+        the same output file resumes from it; the file is removed once the
+        final CSV has been written.
+
         Args:
             input_file: Path to input CSV file
             output_file: Path to output CSV file
@@ -420,7 +1015,11 @@ class NewsLinkScraper:
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"Arquivo {input_file} não encontrado!")
 
-        df = pd.read_csv(input_file)
+        # Read every cell as text: no type inference, empty cells stay "" and
+        # values like "007" or "NA" are written back unchanged. The C engine
+        # is used on purpose: with engine='pyarrow' the types are inferred
+        # first and only then cast to str ("007" -> "7").
+        df = pd.read_csv(input_file, dtype=str, keep_default_na=False)
         self.logger.info(f"Arquivo {input_file} carregado com {len(df)} linhas")
 
         if portal_column not in df.columns:
@@ -430,40 +1029,60 @@ class NewsLinkScraper:
         if news_column not in df.columns:
             df[news_column] = ""
 
+        # Resume from a previous interrupted run
+        progress_file = output_file + PROGRESS_SUFFIX
+        restored = self._replay_progress(df, progress_file, portal_column, news_column)
+
         # Find sites without news links
-        sites_to_process = df[(df[news_column].isna()) | (df[news_column] == "")]
+        missing_news = df[news_column].eq("")
+        sites_to_process = df.loc[missing_news & ~df.index.isin(restored), portal_column]
 
-        if len(sites_to_process) == 0:
+        if len(sites_to_process) == 0 and not restored:
             self.logger.info("Todos os sites já têm links de notícias!")
-            return len(df), len(df[df[news_column] != ""])
+            return len(df), int(df[news_column].ne("").sum())
 
         self.logger.info(f"Processando {len(sites_to_process)} sites sem links de notícias")
 
         total_processed = 0
-        for index, row in sites_to_process.iterrows():
-            url = row[portal_column]
-            total_processed += 1
-
-            self.logger.info(f"Processando ({total_processed}/{len(sites_to_process)}): {url}")
-
-            # Find news link
-            news_link = self.find_news_link(url)
-            df.at[index, news_column] = news_link
-
-            # Rate limiting
-            time.sleep(self.request_delay)
-
-            # Save progress periodically
-            if total_processed % 5 == 0:
-                df.to_csv(output_file, index=False)
-                self.logger.info(f"Progresso salvo: {total_processed} sites processados")
-
-        # Save final results
-        df.to_csv(output_file, index=False)
+        pending: List[Tuple[Hashable, str]] = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                    open(progress_file, 'a', encoding='utf-8') as progress:
+                futures = {
+                    executor.submit(self._process_site, url): (index, url)
+                    for index, url in self._interleave_by_host(sites_to_process)
+                }
+
+                try:
+                    for future in as_completed(futures):
+                        index, url = futures[future]
+                        news_link = future.result()
+                        pending.append((index, news_link))
+                        total_processed += 1
+
+                        # Append-only progress log, cheap enough to write per site
+                        entry = {'idx': index, 'url': url, 'news': news_link}
+                        progress.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                        progress.flush()
+
+                        if total_processed % 50 == 0:
+                            self.logger.info(f"Progresso: {total_processed} sites processados")
+                except BaseException:
+                    # Don't start queued sites when interrupted (e.g. Ctrl+C)
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        finally:
+            # Save final results (partial results if interrupted)
+            self._apply_results(df, news_column, pending)
+            df.to_csv(output_file, index=False)
+            self.close()
+
+        # The final CSV holds every result; the progress file is no longer needed
+        os.remove(progress_file)
 
         # Calculate statistics
         total_sites = len(df)
-        sites_with_news = len(df[df[news_column] != ""])
+        sites_with_news = int(df[news_column].ne("").sum())
         sites_without_news = total_sites - sites_with_news
         success_rate = (sites_with_news / total_sites) * 100
 
@@ -473,6 +1092,10 @@ class NewsLinkScraper:
         self.logger.info(f"Sites com links de notícias: {sites_with_news}")
         self.logger.info(f"Sites sem notícias: {sites_without_news}")
         self.logger.info(f"Taxa de sucesso: {success_rate:.1f}%")
+        self.logger.info(f"Timeouts: {self._metrics['timeout']}")
+        self.logger.info(f"Erros de requisição: {self._metrics['request_error']}")
+        self.logger.info(f"Páginas sem menção a notícias: {self._metrics['skipped_parse']}")
+        self.logger.info(f"Respostas não-HTML: {self._metrics['not_html']}")
 
         return total_sites, sites_with_news
 
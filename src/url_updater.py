@@ -12,6 +12,17 @@ from typing import Dict, List, Tuple
 import pandas as pd
 import yaml
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as YAMLDumper
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as YAMLDumper
+    from yaml import SafeLoader as YAMLLoader
+
+GOVBR_PREFIX = 'https://www.gov.br/'
+AGENCY_PATTERN = re.compile(r'^https://www\.gov\.br/([^/]+)/pt-br')
+
 
 class URLUpdater:
     """Updates site_urls.yaml based on scraped results and intelligent validation."""
@@ -32,18 +43,24 @@ class URLUpdater:
             console_handler.setFormatter(formatter)
             logger.addHandler(console_handler)
         
+        if not yaml.__with_libyaml__:
+            logger.debug("libyaml indisponível, usando o parser YAML em Python puro")
+        
         return logger
 
     def extract_agency_code(self, portal_url: str) -> str:
         """Extract agency code from portal URL."""
-        match = re.search(r'https://www\.gov\.br/([^/]+)/pt-br', portal_url)
+        # Cheap prefix check before running the regex on non gov.br URLs
+        if not portal_url.startswith(GOVBR_PREFIX):
+            return ""
+        match = AGENCY_PATTERN.match(portal_url)
         return match.group(1) if match else ""
 
     def load_yaml_urls(self, yaml_file: str) -> Dict[str, str]:
         """Load URLs from YAML file."""
         try:
             with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YAMLLoader)
             return data.get('agencies', {})
         except Exception as e:
             self.logger.error(f"Erro ao carregar arquivo YAML {yaml_file}: {e}")
@@ -54,7 +71,7 @@ class URLUpdater:
         try:
             data = {'agencies': urls}
             with open(output_file, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=True)
+                yaml.dump(data, f, Dumper=YAMLDumper, default_flow_style=False, allow_unicode=True, sort_keys=True)
             self.logger.info(f"URLs atualizadas salvas em {output_file}")
         except Exception as e:
             self.logger.error(f"Erro ao salvar arquivo YAML {output_file}: {e}")
@@ -85,30 +102,28 @@ class URLUpdater:
         updated_urls = yaml_urls.copy()
         discrepancies = []
         
-        for _, row in scraped_df.iterrows():
-            portal_url = row['Portal']
-            extracted_url = row.get('Noticias', '')
+        portal_urls = scraped_df['Portal']
+        agency_codes = portal_urls.str.extract(AGENCY_PATTERN.pattern, expand=False).fillna('')
+        if 'Noticias' in scraped_df.columns:
+            extracted_urls = scraped_df['Noticias'].fillna('').astype(str).str.strip()
+        else:
+            extracted_urls = pd.Series('', index=scraped_df.index)
+        correct_urls = agency_codes.map(yaml_urls)
+        
+        # Only rows that add an agency or disagree with the YAML need a closer look
+        to_check = (agency_codes != '') & (extracted_urls != '') & (extracted_urls != correct_urls)
+        
+        for portal_url, agency_code, extracted_url in zip(portal_urls[to_check].tolist(),
+                                                          agency_codes[to_check].tolist(),
+                                                          extracted_urls[to_check].tolist()):
             
-            agency_code = self.extract_agency_code(portal_url)
-            if not agency_code:
-                continue
-                
             if agency_code not in yaml_urls:
-                if pd.notna(extracted_url) and extracted_url.strip():
-                    updated_urls[agency_code] = extracted_url.strip()
-                    self.logger.info(f"Nova agência adicionada: {agency_code} -> {extracted_url}")
+                updated_urls[agency_code] = extracted_url
+                self.logger.info(f"Nova agência adicionada: {agency_code} -> {extracted_url}")
                 continue
                 
             correct_url = yaml_urls[agency_code]
             
-            if pd.isna(extracted_url) or not extracted_url.strip():
-                continue
-                
-            extracted_url = extracted_url.strip()
-            
-            if extracted_url == correct_url:
-                continue
-                
             if self.is_url_contained(extracted_url, correct_url):
                 self.logger.info(f"URL extraída válida (contida na correta): {agency_code}")
                 continue
@@ -3,8 +3,14 @@
 import pytest
 import tempfile
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock
 import pandas as pd
+from bs4 import BeautifulSoup
+
+# Don't write scraping_log.txt while running the tests
+os.environ.setdefault('GOVBR_NO_FILE_LOG', '1')
 
 
 @pytest.fixture
@@ -14,7 +20,7 @@ def scraper():
     return NewsLinkScraper(request_delay=0.1)  # Faster for tests
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_with_footer_news():
     """HTML with news link in footer."""
     return """
@@ -30,7 +36,7 @@ def sample_html_with_footer_news():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_with_mais_noticias():
     """HTML with 'Mais Notícias' link but no footer news."""
     return """
@@ -47,7 +53,7 @@ def sample_html_with_mais_noticias():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_with_ultimas_noticias():
     """HTML with 'Últimas Notícias' link but no other news links."""
     return """
@@ -64,7 +70,7 @@ def sample_html_with_ultimas_noticias():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_no_news():
     """HTML with no news links."""
     return """
@@ -80,7 +86,7 @@ def sample_html_no_news():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_no_footer():
     """HTML without footer wrapper."""
     return """
@@ -94,6 +100,39 @@ def sample_html_no_footer():
     """
 
 
+# Parsed once per module; tests only read these trees, never modify them
+
+
+@pytest.fixture(scope="module")
+def footer_news_soup(sample_html_with_footer_news):
+    """Parsed HTML with news link in footer."""
+    return BeautifulSoup(sample_html_with_footer_news, 'lxml')
+
+
+@pytest.fixture(scope="module")
+def mais_noticias_soup(sample_html_with_mais_noticias):
+    """Parsed HTML with 'Mais Notícias' link but no footer news."""
+    return BeautifulSoup(sample_html_with_mais_noticias, 'lxml')
+
+
+@pytest.fixture(scope="module")
+def ultimas_noticias_soup(sample_html_with_ultimas_noticias):
+    """Parsed HTML with 'Últimas Notícias' link but no other news links."""
+    return BeautifulSoup(sample_html_with_ultimas_noticias, 'lxml')
+
+
+@pytest.fixture(scope="module")
+def no_news_soup(sample_html_no_news):
+    """Parsed HTML with no news links."""
+    return BeautifulSoup(sample_html_no_news, 'lxml')
+
+
+@pytest.fixture(scope="module")
+def no_footer_soup(sample_html_no_footer):
+    """Parsed HTML without footer wrapper."""
+    return BeautifulSoup(sample_html_no_footer, 'lxml')
+
+
 @pytest.fixture
 def sample_csv_data():
     """Sample CSV data for testing."""
@@ -125,15 +164,18 @@ def mock_successful_response():
     """Mock a successful HTTP response."""
     mock_response = Mock()
     mock_response.raise_for_status.return_value = None
+    mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+    mock_response.encoding = 'utf-8'
     mock_response.content = """
     <html>
         <body>
             <div class="footer-wrapper">
-                <a href="/noticias">Noticias</a>
+                <a href="/noticias">Notícias</a>
             </div>
         </body>
     </html>
     """.encode('utf-8')
+    mock_response.iter_content.return_value = [mock_response.content]
     return mock_response
 
 
@@ -144,3 +186,31 @@ def mock_failed_response():
     mock_response = Mock()
     mock_response.raise_for_status.side_effect = RequestException("Test error")
     return mock_response
+
+
+class _NewsPageHandler(BaseHTTPRequestHandler):
+    """Serve a small news page over keep-alive HTTP/1.1 connections."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = '<div class="footer-wrapper"><a href="/noticias">Notícias</a></div>'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_news_server():
+    """Run a local HTTP server and yield its base URL."""
+    server = ThreadingHTTPServer(('localhost', 0), _NewsPageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
@@ -3,6 +3,7 @@
 import pytest
 import tempfile
 import os
+import socket
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 from bs4 import BeautifulSoup
@@ -19,6 +20,8 @@ class TestNewsLinkScraper:
         scraper = NewsLinkScraper()
         assert scraper.request_timeout == 30
         assert scraper.request_delay == 2.0
+        assert scraper.max_workers == 20
+        assert scraper.max_per_host == 4
         assert 'Mozilla' in scraper.headers['User-Agent']
 
     def test_init_custom_values(self):
@@ -31,6 +34,61 @@ class TestNewsLinkScraper:
         assert scraper.request_timeout == 10
         assert scraper.request_delay == 1.0
         assert scraper.headers['User-Agent'] == "TestAgent"
+        assert scraper.session.headers['User-Agent'] == "TestAgent"
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context closes the HTTP session."""
+        with patch.object(requests.Session, 'close') as mock_close:
+            with NewsLinkScraper() as scraper:
+                assert isinstance(scraper, NewsLinkScraper)
+                mock_close.assert_not_called()
+
+            mock_close.assert_called_once()
+
+    def test_session_pool_matches_workers(self):
+        """Test that the connection pool is sized to the worker count."""
+        scraper = NewsLinkScraper(max_workers=32)
+        adapter = scraper.session.get_adapter("https://www.gov.br")
+        assert adapter._pool_maxsize == 32
+
+    def test_session_retries_with_backoff(self, scraper):
+        """Test that transient errors are retried with jittered backoff."""
+        retries = scraper.session.get_adapter("https://www.gov.br").max_retries
+        assert retries.total == 5
+        assert retries.backoff_jitter > 0
+        assert retries.respect_retry_after_header
+        assert 429 in retries.status_forcelist
+
+    def test_session_uses_http_cache_when_requested(self):
+        """Test that a cache_path switches to a requests-cache session."""
+        mock_requests_cache = Mock()
+        mock_requests_cache.CachedSession.return_value = requests.Session()
+
+        with patch('govbr_news_scraper.requests_cache', mock_requests_cache):
+            scraper = NewsLinkScraper(cache_path='http_cache')
+
+        mock_requests_cache.CachedSession.assert_called_once()
+        assert mock_requests_cache.CachedSession.call_args.args == ('http_cache',)
+        assert scraper.session is mock_requests_cache.CachedSession.return_value
+        assert scraper.session.headers['User-Agent'] == scraper.headers['User-Agent']
+
+    @patch('govbr_news_scraper.requests_cache', None)
+    def test_session_without_requests_cache_falls_back(self):
+        """Test that a missing requests-cache falls back to a plain session."""
+        scraper = NewsLinkScraper(cache_path='http_cache')
+        assert type(scraper.session) is requests.Session
+
+    def test_session_resolves_host_once(self, local_news_server):
+        """Test that a kept-alive connection skips DNS resolution on later requests."""
+        scraper = NewsLinkScraper(request_delay=0)
+        scraper.session.trust_env = False  # Connect directly even if a proxy is configured
+
+        with patch('socket.getaddrinfo', wraps=socket.getaddrinfo) as mock_getaddrinfo:
+            assert scraper._make_request(f"{local_news_server}/site1") is not None
+            assert scraper._make_request(f"{local_news_server}/site2") is not None
+
+        assert mock_getaddrinfo.call_count == 1
+        scraper.close()
 
     def test_convert_to_absolute_url(self, scraper):
         """Test URL conversion from relative to absolute."""
@@ -49,6 +107,14 @@ class TestNewsLinkScraper:
         result = scraper._convert_to_absolute_url(absolute_url, base_url)
         assert result == absolute_url
 
+        # Test protocol-relative URL
+        result = scraper._convert_to_absolute_url("//cdn.gov.br/noticias", base_url)
+        assert result == "https://cdn.gov.br/noticias"
+
+        # Test relative path that merely starts with "http"
+        result = scraper._convert_to_absolute_url("http-noticias", base_url)
+        assert result == "https://example.gov.br/http-noticias"
+
     def test_find_links_by_text(self, scraper):
         """Test finding links with prioritized text matching."""
         html = """
@@ -60,7 +126,7 @@ class TestNewsLinkScraper:
             <a href="/starts_with2">Notícias Siscomex</a>
         </div>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         # Test prioritized matching for "notícias"
         # Should prioritize exact match "Notícias" over others
@@ -76,7 +142,7 @@ class TestNewsLinkScraper:
             <a href="/starts_with">Notícias 5G</a>
         </div>
         """
-        soup_no_exact = BeautifulSoup(html_no_exact, 'html.parser')
+        soup_no_exact = BeautifulSoup(html_no_exact, 'lxml')
         links = scraper._find_links_by_text(soup_no_exact, "notícias")
         assert len(links) == 1
         assert links[0].get('href') == '/ends_with'
@@ -89,15 +155,77 @@ class TestNewsLinkScraper:
             <a href="/starts_with2">Notícias Siscomex</a>
         </div>
         """
-        soup_starts_only = BeautifulSoup(html_starts_only, 'html.parser')
+        soup_starts_only = BeautifulSoup(html_starts_only, 'lxml')
         links = scraper._find_links_by_text(soup_starts_only, "notícias")
         assert len(links) >= 1  # Should get at least one "starts with" match
         assert links[0].get('href') in ['/starts_with', '/starts_with2']
 
+    def test_find_links_by_text_on_strained_soup(self, scraper):
+        """Test that link matching is unchanged on a soup parsed with the strainer."""
+        from govbr_news_scraper import PAGE_STRAINER
+
+        html = """
+        <footer>
+            <a href="/exact">Notícias</a>
+            <a href="/contact">Contato</a>
+            <div class="footer-wrapper">
+                <a href="/ends_with">Principais Notícias</a>
+                <a href="/exact2">Notícias</a>
+            </div>
+        </footer>
+        """
+        soup = BeautifulSoup(html, 'lxml', parse_only=PAGE_STRAINER)
+
+        links = scraper._find_links_by_text(soup, "notícias")
+        assert [link.get('href') for link in links] == ['/exact', '/exact2']
+
+        footer = soup.find('div', class_='footer-wrapper')
+        links = scraper._find_links_by_text(soup, "notícias", footer)
+        assert [link.get('href') for link in links] == ['/exact2']
+
+    def test_find_links_by_text_with_precomputed_anchors(self, scraper):
+        """Test that precomputed anchors respect the container scope."""
+        html = """
+        <div>
+            <a href="/page-news">Notícias</a>
+            <div class="footer-wrapper">
+                <a href="/footer-news">Notícias</a>
+            </div>
+        </div>
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        anchors = scraper._collect_anchors(soup)
+        assert [(text, href) for _, text, href in anchors] == [
+            ('notícias', '/page-news'),
+            ('notícias', '/footer-news')
+        ]
+
+        footer = soup.find('div', class_='footer-wrapper')
+        links = scraper._find_links_by_text(soup, "notícias", footer, anchors)
+        assert [link.get('href') for link in links] == ['/footer-news']
+
+        links = scraper._find_links_by_text(soup, "notícias", anchors=anchors)
+        assert len(links) == 2
+
+    def test_collect_anchors_normalizes_whitespace(self, scraper):
+        """Test that link texts broken across lines are normalized."""
+        html = """
+        <div>
+            <a href="/ultimas-noticias">
+                Últimas
+                Notícias
+            </a>
+        </div>
+        """
+        soup = BeautifulSoup(html, 'lxml')
+
+        result = scraper._search_latest_news_links(soup, "https://example.gov.br")
+        assert result == "https://example.gov.br/ultimas-noticias"
+
     def test_extract_link_url(self, scraper):
         """Test extracting URL from link tag."""
         html = '<a href="/noticias">Notícias</a>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         link = soup.find('a')
 
         result = scraper._extract_link_url(link, "https://example.gov.br")
@@ -105,41 +233,118 @@ class TestNewsLinkScraper:
 
         # Test link without href
         html_no_href = '<a>Notícias</a>'
-        soup_no_href = BeautifulSoup(html_no_href, 'html.parser')
+        soup_no_href = BeautifulSoup(html_no_href, 'lxml')
         link_no_href = soup_no_href.find('a')
 
         result = scraper._extract_link_url(link_no_href, "https://example.gov.br")
         assert result is None
 
-    def test_search_footer_news_links_success(self, scraper, sample_html_with_footer_news):
+    def test_search_footer_news_links_success(self, scraper, footer_news_soup):
         """Test successful footer news link search."""
-        soup = BeautifulSoup(sample_html_with_footer_news, 'html.parser')
-
-        result = scraper._search_footer_news_links(soup, "https://example.gov.br")
+        result = scraper._search_footer_news_links(footer_news_soup, "https://example.gov.br")
         assert result == "https://example.gov.br/noticias"
 
-    def test_search_footer_news_links_no_footer(self, scraper, sample_html_no_footer):
+    def test_search_footer_news_links_no_footer(self, scraper, no_footer_soup):
         """Test footer search when no footer exists."""
-        soup = BeautifulSoup(sample_html_no_footer, 'html.parser')
-
-        result = scraper._search_footer_news_links(soup, "https://example.gov.br")
+        result = scraper._search_footer_news_links(no_footer_soup, "https://example.gov.br")
         assert result is None
 
-    def test_search_more_news_links_success(self, scraper, sample_html_with_mais_noticias):
+    def test_search_more_news_links_success(self, scraper, mais_noticias_soup):
         """Test successful 'Mais Notícias' search."""
-        soup = BeautifulSoup(sample_html_with_mais_noticias, 'html.parser')
-
-        result = scraper._search_more_news_links(soup, "https://example.gov.br")
+        result = scraper._search_more_news_links(mais_noticias_soup, "https://example.gov.br")
         assert result == "https://example.gov.br/mais-noticias"
 
-    def test_search_latest_news_links_success(self, scraper, sample_html_with_ultimas_noticias):
+    def test_search_latest_news_links_success(self, scraper, ultimas_noticias_soup):
         """Test successful 'Últimas Notícias' search."""
-        soup = BeautifulSoup(sample_html_with_ultimas_noticias, 'html.parser')
-
-        result = scraper._search_latest_news_links(soup, "https://example.gov.br")
+        result = scraper._search_latest_news_links(ultimas_noticias_soup, "https://example.gov.br")
         assert result == "https://example.gov.br/ultimas-noticias"
 
-    @patch('govbr_news_scraper.requests.get')
+    def test_search_feed_news_links_success(self, scraper):
+        """Test finding a news feed declared in <head>."""
+        html = """
+        <html>
+            <head>
+                <link rel="alternate" type="application/rss+xml" title="Portal" href="/RSS">
+                <link rel="alternate" type="application/rss+xml" title="Notícias" href="/assuntos/noticias/RSS">
+            </head>
+            <body><a href="/contato">Contato</a></body>
+        </html>
+        """
+        soup = BeautifulSoup(html, 'lxml')
+
+        result = scraper._search_feed_news_links(soup, "https://example.gov.br")
+        assert result == "https://example.gov.br/assuntos/noticias/RSS"
+
+    @patch('govbr_news_scraper.requests.Session.get')
+    def test_find_news_link_feed_strategy(self, mock_get, scraper, mock_successful_response):
+        """Test that a news feed is used only when no link strategy succeeds."""
+        content = """
+        <html>
+            <head>
+                <link rel="alternate" type="application/atom+xml" title="Últimas Notícias" href="/noticias/atom">
+                <link rel="stylesheet" href="/noticias.css">
+            </head>
+            <body><div class="footer-wrapper"><a href="/contato">Contato</a></div></body>
+        </html>
+        """.encode('utf-8')
+        mock_successful_response.iter_content.return_value = [content]
+        mock_get.return_value = mock_successful_response
+
+        result = scraper.find_news_link("https://example.gov.br")
+        assert result == "https://example.gov.br/noticias/atom"
+
+    @patch('govbr_news_scraper.requests.Session.get')
+    def test_find_news_link_feed_needs_accented_title(self, mock_get, scraper, mock_successful_response):
+        """Test that a feed only named in unaccented form is not used."""
+        content = b"""
+        <html>
+            <head>
+                <link rel="alternate" type="application/rss+xml" title="Noticias" href="/assuntos/noticias/RSS">
+            </head>
+            <body><a href="/contato">Contato</a></body>
+        </html>
+        """
+        mock_successful_response.iter_content.return_value = [content]
+        mock_get.return_value = mock_successful_response
+
+        assert scraper.find_news_link("https://example.gov.br") == ""
+        soup = BeautifulSoup(content, 'lxml')
+        assert scraper._search_feed_news_links(soup, "https://example.gov.br") is None
+
+    def test_select_best_news_link(self, scraper):
+        """Test that the highest score wins and ties keep page order."""
+        html = """
+        <div>
+            <a href="/assuntos/noticias">Notícias</a>
+            <a href="/noticias">Notícias</a>
+            <a href="/comunicacao/noticias">Notícias</a>
+            <a href="/comunicacao/noticias-2">Notícias</a>
+        </div>
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        anchors = scraper._collect_anchors(soup)
+
+        best = scraper._select_best_news_link(anchors, "https://example.gov.br")
+        assert best.get('href') == '/comunicacao/noticias'
+
+        best = scraper._select_best_news_link(anchors[:2], "https://example.gov.br")
+        assert best.get('href') == '/assuntos/noticias'
+
+    def test_search_generic_news_links_skips_promotional(self, scraper):
+        """Test that the generic fallback skips promotional links."""
+        html = """
+        <html><body>
+            <a href="/g20/noticias">Notícias</a>
+            <a href="/campanha">Notícias da Campanha</a>
+            <a href="/assuntos/noticias">Notícias</a>
+        </body></html>
+        """
+        soup = BeautifulSoup(html, 'lxml')
+
+        result = scraper._search_generic_news_links(soup, "https://example.gov.br")
+        assert result == "https://example.gov.br/assuntos/noticias"
+
+    @patch('govbr_news_scraper.requests.Session.get')
     def test_make_request_success(self, mock_get, scraper, mock_successful_response):
         """Test successful HTTP request."""
         mock_get.return_value = mock_successful_response
@@ -147,55 +352,223 @@ class TestNewsLinkScraper:
         result = scraper._make_request("https://example.gov.br")
         assert result is not None
         assert isinstance(result, BeautifulSoup)
+        assert result.find('div', class_='footer-wrapper') is not None
+        assert result.find('a').text == 'Notícias'
+
+    @patch('govbr_news_scraper.requests.Session.get')
+    def test_make_request_parses_only_links_and_divs(self, mock_get, scraper, mock_successful_response):
+        """Test that the parse strainer keeps the footer and nested link markup."""
+        content = """
+        <html>
+            <head><title>Notícias</title><script>var x = 1;</script></head>
+            <body>
+                <header><a href="/noticias">Notícias</a></header>
+                <footer>
+                    <div class="footer-wrapper">
+                        <ul><li><a href="/ultimas"><span>Últimas</span> Notícias</a></li></ul>
+                    </div>
+                </footer>
+            </body>
+        </html>
+        """.encode('utf-8')
+        mock_successful_response.iter_content.return_value = [content]
+        mock_get.return_value = mock_successful_response
+
+        result = scraper._make_request("https://example.gov.br")
+        assert result.find('title') is None
+        assert result.find('script') is None
+        assert len(result.find_all('a')) == 2
+        assert scraper._search_footer_news_links(result, "https://example.gov.br") == "https://example.gov.br/ultimas"
+
+    def test_declared_encoding(self, scraper):
+        """Test that only an explicit charset is passed to the parser."""
+        response = Mock()
+        response.headers = {'Content-Type': 'text/html; charset=ISO-8859-1'}
+        response.encoding = 'ISO-8859-1'
+        assert scraper._declared_encoding(response) == 'ISO-8859-1'
+
+        # requests defaults text/html to ISO-8859-1 even without a charset
+        response.headers = {'Content-Type': 'text/html'}
+        assert scraper._declared_encoding(response) is None
+
+    @patch('govbr_news_scraper.requests.Session.get')
+    def test_make_request_skips_pages_without_news(self, mock_get, scraper, mock_successful_response):
+        """Test that pages never mentioning news are not parsed."""
+        content = b'<html><body><a href="/contato">Contato</a></body></html>'
+        mock_successful_response.iter_content.return_value = [content]
+        mock_get.return_value = mock_successful_response
+
+        result = scraper._make_request("https://example.gov.br")
+        assert result is None
+
+    @patch('govbr_news_scraper.requests.Session.get')
+    def test_make_request_skips_non_html(self, mock_get, scraper, mock_successful_response):
+        """Test that non-HTML responses are neither read nor parsed."""
+        mock_successful_response.headers = {'Content-Type': 'application/pdf'}
+        mock_get.return_value = mock_successful_response
 
-    @patch('govbr_news_scraper.requests.get')
+        result = scraper._make_request("https://example.gov.br/arquivo.pdf")
+        assert result is None
+        assert scraper._metrics['not_html'] == 1
+        mock_successful_response.iter_content.assert_not_called()
+        mock_successful_response.close.assert_called_once()
+
+    def test_news_text_probe_encodings(self):
+        """Test that the raw probe recognizes common encodings of 'notícias'."""
+        from govbr_news_scraper import NEWS_TEXT_PROBE
+
+        assert NEWS_TEXT_PROBE.search('Últimas Notícias'.encode('utf-8'))
+        assert NEWS_TEXT_PROBE.search('NOTÍCIAS'.encode('utf-8'))
+        assert NEWS_TEXT_PROBE.search('Notícias'.encode('latin-1'))
+        assert NEWS_TEXT_PROBE.search(b'Not&iacute;cias')
+        assert NEWS_TEXT_PROBE.search(b'Not&#237;cias')
+        assert not NEWS_TEXT_PROBE.search(b'<a href="/noticias">Contato</a>')
+
+    @patch('govbr_news_scraper.MAX_PAGE_BYTES', 10)
+    def test_read_content_truncates_large_pages(self, scraper):
+        """Test that streamed bodies stop being read past the size limit."""
+        response = Mock()
+        response.iter_content.return_value = iter([b'a' * 6, b'b' * 6, b'c' * 6])
+
+        result = scraper._read_content(response, "https://example.gov.br")
+        assert result == b'a' * 6 + b'b' * 6
+
+    @patch('govbr_news_scraper.requests.Session.get')
     def test_make_request_timeout(self, mock_get, scraper):
         """Test HTTP request timeout."""
         mock_get.side_effect = requests.exceptions.Timeout("Timeout")
 
         result = scraper._make_request("https://example.gov.br")
         assert result is None
+        assert scraper._metrics['timeout'] == 1
 
-    @patch('govbr_news_scraper.requests.get')
+    @patch('govbr_news_scraper.requests.Session.get')
     def test_make_request_http_error(self, mock_get, scraper):
         """Test HTTP request error."""
         mock_get.side_effect = requests.exceptions.RequestException("HTTP Error")
 
         result = scraper._make_request("https://example.gov.br")
         assert result is None
+        assert scraper._metrics['request_error'] == 1
+
+    @patch('govbr_news_scraper.requests.Session.get')
+    def test_make_request_unexpected_error_propagates(self, mock_get, scraper):
+        """Test that non-network errors are not swallowed."""
+        mock_get.side_effect = ValueError("Bug")
+
+        with pytest.raises(ValueError):
+            scraper._make_request("https://example.gov.br")
+
+    @patch('govbr_news_scraper.time.sleep')
+    def test_wait_for_host(self, mock_sleep, scraper):
+        """Test that only repeated requests to the same host are delayed."""
+        scraper._wait_for_host("https://a.gov.br/site1")
+        scraper._wait_for_host("https://b.gov.br/site1")
+        mock_sleep.assert_not_called()
+
+        scraper._wait_for_host("https://a.gov.br/site2")
+        mock_sleep.assert_called_once()
+
+    @patch('govbr_news_scraper.time.sleep')
+    @patch('govbr_news_scraper.requests.Session.get')
+    def test_make_request_cached_skips_host_delay(self, mock_get, mock_sleep, scraper,
+                                                  mock_successful_response):
+        """Test that responses already in the HTTP cache are not delayed."""
+        mock_get.return_value = mock_successful_response
+        scraper.session.cache = Mock()
+        scraper.session.cache.contains.return_value = True
+
+        scraper._make_request("https://www.gov.br/mec/pt-br")
+        scraper._make_request("https://www.gov.br/saude/pt-br")
+        mock_sleep.assert_not_called()
+        scraper.session.cache.contains.assert_called_with(url="https://www.gov.br/saude/pt-br")
+
+        scraper.session.cache.contains.return_value = False
+        scraper._make_request("https://www.gov.br/mec/pt-br")
+        scraper._make_request("https://www.gov.br/saude/pt-br")
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= scraper.request_delay
+
+    def test_host_semaphore(self):
+        """Test that concurrent requests are capped per host."""
+        scraper = NewsLinkScraper(max_per_host=2)
+        semaphore = scraper._host_semaphore("https://a.gov.br/site1")
+
+        assert scraper._host_semaphore("https://a.gov.br/site2") is semaphore
+        assert scraper._host_semaphore("https://b.gov.br/site1") is not semaphore
+        assert semaphore.acquire(blocking=False)
+        assert semaphore.acquire(blocking=False)
+        assert not semaphore.acquire(blocking=False)
+
+    def test_interleave_by_host(self, scraper):
+        """Test that sites are scheduled round-robin by host."""
+        urls = pd.Series([
+            'https://a.gov.br/1',
+            'https://a.gov.br/2',
+            'https://b.gov.br/1',
+            'https://a.gov.br/3'
+        ])
+
+        result = scraper._interleave_by_host(urls)
+        assert [index for index, _ in result] == [0, 2, 1, 3]
 
     @patch.object(NewsLinkScraper, '_make_request')
-    def test_find_news_link_footer_strategy(self, mock_request, scraper, sample_html_with_footer_news):
+    def test_find_news_link_footer_strategy(self, mock_request, scraper, footer_news_soup):
         """Test find_news_link with footer strategy."""
-        mock_request.return_value = BeautifulSoup(sample_html_with_footer_news, 'html.parser')
+        mock_request.return_value = footer_news_soup
 
         result = scraper.find_news_link("https://example.gov.br")
         assert result == "https://example.gov.br/noticias"
 
     @patch.object(NewsLinkScraper, '_make_request')
-    def test_find_news_link_mais_noticias_strategy(self, mock_request, scraper, sample_html_with_mais_noticias):
+    def test_find_news_link_mais_noticias_strategy(self, mock_request, scraper, mais_noticias_soup):
         """Test find_news_link with 'Mais Notícias' fallback strategy."""
-        mock_request.return_value = BeautifulSoup(sample_html_with_mais_noticias, 'html.parser')
+        mock_request.return_value = mais_noticias_soup
 
         result = scraper.find_news_link("https://example.gov.br")
         assert result == "https://example.gov.br/mais-noticias"
 
     @patch.object(NewsLinkScraper, '_make_request')
-    def test_find_news_link_ultimas_noticias_strategy(self, mock_request, scraper, sample_html_with_ultimas_noticias):
+    def test_find_news_link_ultimas_noticias_strategy(self, mock_request, scraper, ultimas_noticias_soup):
         """Test find_news_link with 'Últimas Notícias' fallback strategy."""
-        mock_request.return_value = BeautifulSoup(sample_html_with_ultimas_noticias, 'html.parser')
+        mock_request.return_value = ultimas_noticias_soup
 
         result = scraper.find_news_link("https://example.gov.br")
         assert result == "https://example.gov.br/ultimas-noticias"
 
     @patch.object(NewsLinkScraper, '_make_request')
-    def test_find_news_link_no_news_found(self, mock_request, scraper, sample_html_no_news):
+    def test_find_news_link_no_news_found(self, mock_request, scraper, no_news_soup):
         """Test find_news_link when no news links are found."""
-        mock_request.return_value = BeautifulSoup(sample_html_no_news, 'html.parser')
+        mock_request.return_value = no_news_soup
 
         result = scraper.find_news_link("https://example.gov.br")
         assert result == ""
 
+    @patch.object(NewsLinkScraper, '_make_request')
+    def test_find_news_link_walks_page_once(self, mock_request, scraper):
+        """Test that all strategies share a single pass over the page links."""
+        # A news link without href: every strategy runs and fails
+        html = '<div class="footer-wrapper"><a>Notícias</a></div>'
+        mock_request.return_value = BeautifulSoup(html, 'lxml')
+
+        with patch.object(scraper, '_collect_anchors', wraps=scraper._collect_anchors) as mock_collect, \
+                patch.object(scraper, '_search_generic_news_links',
+                             wraps=scraper._search_generic_news_links) as mock_generic:
+            assert scraper.find_news_link("https://example.gov.br") == ""
+
+        mock_generic.assert_called_once()
+        mock_collect.assert_called_once()
+
+    @patch.object(NewsLinkScraper, '_search_footer_news_links')
+    @patch.object(NewsLinkScraper, '_make_request')
+    def test_find_news_link_skips_strategies_without_candidates(self, mock_request, mock_footer,
+                                                                scraper, no_news_soup):
+        """Test that pages without any news link return before the strategies run."""
+        mock_request.return_value = no_news_soup
+
+        assert scraper.find_news_link("https://example.gov.br") == ""
+        mock_footer.assert_not_called()
+
     @patch.object(NewsLinkScraper, '_make_request')
     def test_find_news_link_request_fails(self, mock_request, scraper):
         """Test find_news_link when HTTP request fails."""
@@ -218,12 +591,14 @@ class TestNewsLinkScraper:
     @patch('govbr_news_scraper.time.sleep')  # Mock sleep to speed up tests
     def test_process_csv_file_success(self, mock_sleep, mock_find_news, scraper, temp_csv_file):
         """Test successful CSV processing."""
-        # Mock find_news_link to return different results
-        mock_find_news.side_effect = [
-            "https://example.gov.br/site1/noticias",
-            "",  # No news found for site2
-            "https://example.gov.br/site3/noticias"
-        ]
+        # Mock find_news_link to return different results (keyed by URL,
+        # since sites are processed concurrently)
+        news_links = {
+            'https://example.gov.br/site1': "https://example.gov.br/site1/noticias",
+            'https://example.gov.br/site2': "",  # No news found for site2
+            'https://example.gov.br/site3': "https://example.gov.br/site3/noticias"
+        }
+        mock_find_news.side_effect = news_links.get
 
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as output_file:
             total_sites, sites_with_news = scraper.process_csv_file(
@@ -244,6 +619,95 @@ class TestNewsLinkScraper:
 
         os.unlink(output_file.name)
 
+    @patch.object(NewsLinkScraper, '_make_request')
+    def test_process_csv_file_fetches_repeated_portal_once(self, mock_request, scraper,
+                                                           footer_news_soup):
+        """Test that a portal listed twice is fetched only once."""
+        mock_request.return_value = footer_news_soup
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as input_file:
+            input_file.write(
+                "Portal\n"
+                "https://example.gov.br/site1\n"
+                "https://EXAMPLE.gov.br/site1#inicio\n"
+            )
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as output_file:
+            total_sites, sites_with_news = scraper.scrape_from_csv(input_file.name, output_file.name)
+
+            assert (total_sites, sites_with_news) == (2, 2)
+            assert mock_request.call_count == 1
+
+        os.unlink(input_file.name)
+        os.unlink(output_file.name)
+
+    @patch.object(NewsLinkScraper, 'find_news_link')
+    def test_process_csv_file_keeps_cells_as_text(self, mock_find_news, scraper):
+        """Test that input cells are written back without type conversion."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as input_file:
+            input_file.write(
+                "Portal,Código,Peso,Ativo,Sigla,Noticias\n"
+                "https://example.gov.br/site1,007,1.50,true,NA,\n"
+                "https://example.gov.br/site2,010,2.00,false,MEC,https://example.gov.br/site2/noticias\n"
+            )
+
+        mock_find_news.return_value = ""
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as output_file:
+            total_sites, sites_with_news = scraper.scrape_from_csv(input_file.name, output_file.name)
+
+            assert (total_sites, sites_with_news) == (2, 1)
+            mock_find_news.assert_called_once_with('https://example.gov.br/site1')
+
+            with open(output_file.name, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            assert lines[1] == "https://example.gov.br/site1,007,1.50,true,NA,"
+            assert lines[2] == "https://example.gov.br/site2,010,2.00,false,MEC,https://example.gov.br/site2/noticias"
+
+        os.unlink(input_file.name)
+        os.unlink(output_file.name)
+
+    @patch.object(NewsLinkScraper, 'find_news_link')
+    def test_process_csv_file_saves_partial_results_on_interrupt(self, mock_find_news, temp_csv_file):
+        """Test that results found before an interruption are saved and resumed."""
+        scraper = NewsLinkScraper(request_delay=0.1, max_workers=1)
+        news_links = {'https://example.gov.br/site1': "https://example.gov.br/site1/noticias"}
+
+        def find_news_link(url):
+            if url not in news_links:
+                raise KeyboardInterrupt
+            return news_links[url]
+
+        mock_find_news.side_effect = find_news_link
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as output_file:
+            progress_file = output_file.name + '.partial.jsonl'
+
+            with pytest.raises(KeyboardInterrupt):
+                scraper.scrape_from_csv(temp_csv_file, output_file.name)
+
+            result_df = pd.read_csv(output_file.name)
+            assert result_df.loc[0, 'Noticias'] == "https://example.gov.br/site1/noticias"
+            assert os.path.exists(progress_file)
+
+            # Resuming skips the site already saved in the progress file
+            news_links['https://example.gov.br/site2'] = ""
+            news_links['https://example.gov.br/site3'] = "https://example.gov.br/site3/noticias"
+            mock_find_news.reset_mock()
+
+            total_sites, sites_with_news = scraper.scrape_from_csv(temp_csv_file, output_file.name)
+
+            assert (total_sites, sites_with_news) == (3, 2)
+            called_urls = {call.args[0] for call in mock_find_news.call_args_list}
+            assert 'https://example.gov.br/site1' not in called_urls
+            assert not os.path.exists(progress_file)
+
+            result_df = pd.read_csv(output_file.name)
+            assert result_df.loc[0, 'Noticias'] == "https://example.gov.br/site1/noticias"
+            assert result_df.loc[2, 'Noticias'] == "https://example.gov.br/site3/noticias"
+
+        os.unlink(output_file.name)
+
     @patch.object(NewsLinkScraper, 'find_news_link')
     @patch('govbr_news_scraper.time.sleep')
     def test_process_csv_file_with_existing_news_column(self, mock_sleep, mock_find_news, scraper):
@@ -267,10 +731,11 @@ class TestNewsLinkScraper:
             df.to_csv(input_file.name, index=False)
 
             # Mock find_news_link for the two empty entries
-            mock_find_news.side_effect = [
-                "https://example.gov.br/site2/noticias",
-                "https://example.gov.br/site3/noticias"
-            ]
+            news_links = {
+                'https://example.gov.br/site2': "https://example.gov.br/site2/noticias",
+                'https://example.gov.br/site3': "https://example.gov.br/site3/noticias"
+            }
+            mock_find_news.side_effect = news_links.get
 
             with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as output_file:
                 total_sites, sites_with_news = scraper.process_csv_file(
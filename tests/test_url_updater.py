@@ -0,0 +1,55 @@
+"""Tests for the URL updater."""
+
+import numpy as np
+import pandas as pd
+
+from src.url_updater import URLUpdater
+
+
+class TestURLUpdater:
+    """Test cases for URLUpdater class."""
+
+    def test_validate_and_update_urls(self):
+        """Test that new agencies are added and only real mismatches are reported."""
+        updater = URLUpdater()
+        yaml_urls = {
+            'mec': 'https://www.gov.br/mec/pt-br/assuntos/noticias',
+            'saude': 'https://www.gov.br/saude/pt-br/assuntos/noticias',
+            'mre': 'https://www.gov.br/mre/pt-br/canais_atendimento/imprensa/notas-a-imprensa',
+        }
+        scraped_df = pd.DataFrame({
+            'Portal': [
+                'https://www.gov.br/mec/pt-br',
+                'https://www.gov.br/saude/pt-br',
+                'https://www.gov.br/mre/pt-br',
+                'https://www.gov.br/mre/pt-br',
+                'https://www.gov.br/inep/pt-br',
+                'https://www.gov.br/anvisa/pt-br',
+                'https://www.example.com/pt-br',
+            ],
+            'Noticias': [
+                'https://www.gov.br/mec/pt-br/assuntos/noticias',
+                ' https://www.gov.br/saude/pt-br/assuntos/ ',
+                'https://www.gov.br/mre/pt-br/noticias',
+                'https://www.gov.br/mre/pt-br/noticias',
+                'https://www.gov.br/inep/pt-br/assuntos/noticias',
+                np.nan,
+                'https://www.example.com/noticias',
+            ],
+        })
+
+        updated_urls, discrepancies = updater.validate_and_update_urls(scraped_df, yaml_urls)
+
+        assert updated_urls == {
+            **yaml_urls,
+            'inep': 'https://www.gov.br/inep/pt-br/assuntos/noticias',
+        }
+        assert discrepancies == [
+            {
+                'agency': 'mre',
+                'portal_url': 'https://www.gov.br/mre/pt-br',
+                'extracted_url': 'https://www.gov.br/mre/pt-br/noticias',
+                'correct_url': yaml_urls['mre'],
+                'action': 'discrepancy',
+            },
+        ] * 2